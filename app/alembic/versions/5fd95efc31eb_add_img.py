@@ -19,12 +19,26 @@ depends_on = None
 def upgrade():
     # ### commands auto generated by Alembic - please adjust! ###
     op.add_column("pecha", sa.Column("img", sa.String(), nullable=True))
-    op.create_index(op.f("ix_pecha_img"), "pecha", ["img"], unique=False)
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction, so the
+    # index build leaves the migration transaction; writes to pecha are
+    # not blocked while it runs.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_pecha_img"),
+            "pecha",
+            ["img"],
+            unique=False,
+            postgresql_where=sa.text("img IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
     # ### end Alembic commands ###
 
 
 def downgrade():
     # ### commands auto generated by Alembic - please adjust! ###
-    op.drop_index(op.f("ix_pecha_img"), table_name="pecha")
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f("ix_pecha_img"), table_name="pecha", postgresql_concurrently=True
+        )
     op.drop_column("pecha", "img")
     # ### end Alembic commands ###
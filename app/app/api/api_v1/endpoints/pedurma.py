@@ -1,7 +1,9 @@
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Response, status
 from pedurma import (
     PageNumMissing,
     get_pedurma_text_edit_notes,
@@ -13,28 +15,54 @@ from pedurma import (
 
 from app import schemas
 from app.models.pecha import Pecha
-from app.schemas.pecha import PedurmaPreviewPage
 from app.services.pedurma import create_text_release
 
 router = APIRouter()
 
+TEXT_CACHE_TTL = 60  # seconds
 
-@router.get("/{pecha_id}/texts/{text_id}", response_model=schemas.Text)
-def read_text(pecha_id: str, text_id: str, page_no: Optional[int] = None):
+
+def get_ttl_hash(ttl: int = TEXT_CACHE_TTL) -> int:
+    """Return a value that changes every `ttl` seconds.
+
+    Used as part of the cache key so entries expire: gunicorn runs one
+    worker per core and cache_clear() only reaches the worker that
+    handled the save, so cross-worker staleness must be time-bounded.
+    """
+    return int(time.time() / ttl)
+
+
+@lru_cache(maxsize=1024)
+def get_cached_text(pecha_id: str, text_id: str, ttl_hash: int = None) -> schemas.Text:
+    del ttl_hash
+    return get_text_obj(pecha_id, text_id)
+
+
+@router.get("/{pecha_id}/texts/{text_id}")
+def read_text(
+    response: Response, pecha_id: str, text_id: str, page_no: Optional[int] = None
+) -> schemas.Text:
     """
     Retrieve text from pecha
     """
-    text = get_text_obj(pecha_id, text_id)
+    response.headers["Cache-Control"] = "public, max-age=60"
+    text = get_cached_text(pecha_id, text_id, get_ttl_hash())
+    if page_no:
+        pages = [page for page in text.pages if page.page_no == page_no]
+        if not pages:
+            raise HTTPException(status_code=404, detail="Page not found")
+        return text.copy(update={"pages": pages})
     return text
 
 
 @router.put("/{pecha_id}/texts/{text_id}")
 def update_text(pecha_id: str, text_id: str, text_obj: schemas.Text):
     save_text(pecha_id, text_obj, needs_update=False)
+    get_cached_text.cache_clear()
     return {"message": f"{text_id} saved successfully"}
 
 
-@router.post("/preview", response_model=schemas.PedurmaPreviewPage)
+@router.post("/preview")
 def pedurma_page_preview(
     google_page: schemas.Page,
     google_page_note: schemas.NotesPage,
@@ -47,11 +75,11 @@ def pedurma_page_preview(
         )
     except PageNumMissing:
         raise HTTPException(status_code=422, detail="page number is missing in notes")
-    return PedurmaPreviewPage(content=preview_page)
+    return {"content": preview_page}
 
 
 @router.get("/{text_id}/preview")
-def pedurma_page_preview(text_id: str):
+def pedurma_text_preview(text_id: str):
     download_url = create_text_release(text_id)
     return {"download_url": download_url}
 
@@ -65,6 +93,7 @@ def get_text_notes(text_id: str):
 @router.post("/{text_id}/notes")
 def update_text_notes(text_id: str, notes: List[schemas.pecha.PedurmaNoteEdit]):
     update_text_pagination(text_id, notes)
+    get_cached_text.cache_clear()
 
 
 @router.post("/{task_name}/completed", status_code=status.HTTP_201_CREATED)
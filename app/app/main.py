@@ -1,5 +1,7 @@
+import hashlib
+
 import sentry_sdk
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from sentry_sdk.integrations.asgi import SentryAsgiMiddleware
 
@@ -24,6 +26,45 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_headers=["*"],
     )
 
+
+@app.middleware("http")
+async def etag_middleware(request: Request, call_next):
+    """Return 304 Not Modified when the client already has the response.
+
+    API responses are deterministic for a given resource state, so hash
+    the body and short-circuit with 304 when If-None-Match matches.
+    """
+    response = await call_next(request)
+    if (
+        request.method != "GET"
+        or response.status_code != 200
+        or not request.url.path.startswith(settings.API_V1_STR)
+    ):
+        return response
+
+    body = b""
+    async for chunk in response.body_iterator:
+        body += chunk
+    # RFC 7232 entity-tags are quoted strings
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+    headers = dict(response.headers)
+    headers["ETag"] = etag
+
+    if request.headers.get("If-None-Match") == etag:
+        # keep the original headers (Cache-Control, CORS, ...) on the
+        # 304; only the body and its length are dropped.
+        headers.pop("content-length", None)
+        return Response(status_code=304, headers=headers)
+
+    return Response(
+        content=body,
+        status_code=response.status_code,
+        headers=headers,
+        media_type=response.media_type,
+    )
+
+
 if settings.SENTRY_DSN:
     sentry_sdk.init(dsn=settings.SENTRY_DSN)
     app.add_middleware(SentryAsgiMiddleware)
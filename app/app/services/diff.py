@@ -1,7 +1,14 @@
+from functools import lru_cache
+
 from antx.core import get_diffs
 from botok import BoString
 
 
+@lru_cache(maxsize=1024)
+def _char_category(char):
+    return BoString(char).get_categories()[0]
+
+
 class Diff:
     """
     Diff class to finds diffs and make diffs presentable.
@@ -14,40 +21,34 @@ class Diff:
         text2 (str): text to be diff against by text1
     """
 
-    def __init__(self, text1, text2):
-        self.text1 = text1
-        self.text2 = text2
-        self.sub_char_types = [
+    sub_char_types = frozenset(
+        (
             "SKRT_SUB_CONS",
             "VOW",
             "NFC",
             "SKRT_VOW",
             "IN_SYL_MARK",
-            "IN_SYL_MARK",
             "KRT_LONG_VOW",
-            "SKRT_SUB_CONS",
             "SUB_CONS",
-            "IN_SYL_MARK",
-        ]
+        )
+    )
+
+    def __init__(self, text1, text2):
+        self.text1 = text1
+        self.text2 = text2
 
     def __get_type(self, char):
-        b = BoString(char)
-        return b.get_categories()[0]
+        return _char_category(char)
 
     def __is_sub_char(self, char):
         return self.__get_type(char) in self.sub_char_types
 
     def __get_last_mingshi(self, text):
         """Return last mingshi of text."""
-        mighshi = ""
-        for char in reversed(text):
-            if self.__is_sub_char(char):
-                mighshi += char
-            else:
-                mighshi += char
-                break
-
-        return "".join(reversed(mighshi))
+        for i in range(len(text) - 1, -1, -1):
+            if not self.__is_sub_char(text[i]):
+                return text[i:]
+        return text
 
     def __handle_sub_char(self, diffs):
         """attach sub char to previous char.
@@ -65,23 +66,80 @@ class Diff:
             0FB2,—ྲ—,SUB_CONS
             —༵—,IN_SYL_MARK
         """
-        diffs = list(diffs)
-        for i in range(len(diffs)):
-            op, chunk = diffs[i]
-            if self.__is_sub_char(chunk[0]):
-                pre_op, pre_chunk = diffs[i - 1]
+        if not isinstance(diffs, list):
+            diffs = list(diffs)
+        for i, (op, chunk) in enumerate(diffs):
+            if i == 0 or not chunk or not self.__is_sub_char(chunk[0]):
+                continue
+            pre_op, pre_chunk = diffs[i - 1]
 
-                # add previous chunk's last mingshi to current chunk
-                pre_chunk_last_mingshi = self.__get_last_mingshi(pre_chunk)
-                chunk = pre_chunk_last_mingshi + chunk
-                diffs[i] = (op, chunk)
+            # add previous chunk's last mingshi to current chunk
+            pre_chunk_last_mingshi = self.__get_last_mingshi(pre_chunk)
+            diffs[i] = (op, pre_chunk_last_mingshi + chunk)
 
-                # remove last mingshi from previous chunk
-                diffs[i - 1] = (pre_op, pre_chunk[: -len(pre_chunk_last_mingshi)])
+            # remove last mingshi from previous chunk
+            diffs[i - 1] = (
+                pre_op,
+                pre_chunk[: len(pre_chunk) - len(pre_chunk_last_mingshi)],
+            )
 
         return diffs
 
+    @staticmethod
+    def __common_prefix_len(text1, text2):
+        """Return length of the common prefix of both texts.
+
+        Binary search with slice comparison, so the comparisons run in C.
+        """
+        lo, hi = 0, min(len(text1), len(text2))
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if text1[:mid] == text2[:mid]:
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+
+    @staticmethod
+    def __common_suffix_len(text1, text2):
+        """Return length of the common suffix of both texts."""
+        lo, hi = 0, min(len(text1), len(text2))
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if text1[len(text1) - mid :] == text2[len(text2) - mid :]:
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+
     def compute(self):
-        diffs = get_diffs(self.text1, self.text2)
+        # strip the common affixes so only the changed middle goes
+        # through the diff; texts mostly agree, so this shrinks the
+        # expensive diff input and skips it entirely for equal texts.
+        text1, text2 = self.text1, self.text2
+        prefix_len = self.__common_prefix_len(text1, text2)
+        prefix = text1[:prefix_len]
+        text1, text2 = text1[prefix_len:], text2[prefix_len:]
+        suffix_len = self.__common_suffix_len(text1, text2)
+        suffix = text1[len(text1) - suffix_len :] if suffix_len else ""
+        if suffix_len:
+            text1, text2 = text1[:-suffix_len], text2[:-suffix_len]
+
+        if text1 or text2:
+            diffs = list(get_diffs(text1, text2))
+        else:
+            diffs = []
+
+        if prefix:
+            if diffs and diffs[0][0] == 0:
+                diffs[0] = (0, prefix + diffs[0][1])
+            else:
+                diffs.insert(0, (0, prefix))
+        if suffix:
+            if diffs and diffs[-1][0] == 0:
+                diffs[-1] = (0, diffs[-1][1] + suffix)
+            else:
+                diffs.append((0, suffix))
+
         diffs = self.__handle_sub_char(diffs)
         return diffs
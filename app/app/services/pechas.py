@@ -71,12 +71,18 @@ def get_old_base(pecha_id, base_id):
 def update_base_layer(pecha_id, base_name, new_base, layers):
     pecha = get_pecha(pecha_id)
     old_base = pecha.get_base(base_name)
-    pecha.base[base_name] = new_base
-    pecha.save_base()
 
-    updater = Blupdate(old_base, new_base)
+    # an unchanged base can't shift annotation spans, so only the
+    # diffing is skippable; submitted layers are still persisted.
+    base_changed = old_base != new_base
+    if base_changed:
+        pecha.base[base_name] = new_base
+        pecha.save_base()
+        updater = Blupdate(old_base, new_base)
+
     for layer in layers:
-        update_ann_layer(layer, updater)
+        if base_changed:
+            update_ann_layer(layer, updater)
         pecha.save_layer(
             base_name, layer["annotation_type"].value, Layer.parse_obj(layer)
         )
@@ -1,4 +1,3 @@
-import re
 import shutil
 import tempfile
 from pathlib import Path
@@ -14,10 +13,8 @@ from app.core.config import settings
 
 def save_preview(text_id: str, text_preview: Dict[str, str], path: Path):
     text_fn = path / f"{text_id}.txt"
-    content_all = ""
-    for _, content in text_preview.items():
-        content_all += content
-    text_fn.write_text(content_all)
+    with text_fn.open("w") as fn:
+        fn.writelines(text_preview.values())
     return text_fn
 
 
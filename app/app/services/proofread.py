@@ -89,18 +89,13 @@ class Metadata:
         return {"revision": 0, "image_url": image_url, "offset": offset}
 
     def save_page(self, vol_id: str, page_id: str, image_url: str, offset=None):
-        self.get_pages(vol_id)
-        if (
-            page_id not in self._metadata[vol_id]["pages"]
-            or not self._metadata[vol_id]["pages"][page_id]
-        ):
-            self._metadata[vol_id]["pages"][page_id] = self.__create_page(
-                image_url, offset
-            )
+        pages = self.get_pages(vol_id)
+        if page_id not in pages or not pages[page_id]:
+            pages[page_id] = self.__create_page(image_url, offset)
             self.__save_metadata()
             return
 
-        page = self._metadata[vol_id]["pages"][page_id]
+        page = pages[page_id]
         page["revision"] = self.__increment_page_revision(page)
         page["image_url"] = image_url
         page["offset"] = offset
@@ -111,21 +106,22 @@ class Metadata:
         return f"{n:04}"
 
     def __get_previous_offset(self, vol_id: str, page_id: str) -> int:
+        pages = self._metadata[vol_id]["pages"]
         prev_page = {}
         prev_page_id = page_id
         while "offset" not in prev_page:
             prev_page_id = self.__int2page_id(int(prev_page_id) - 1)
             if prev_page_id == "0000":
                 return 0
-            prev_page = self._metadata[vol_id]["pages"][prev_page_id]
+            prev_page = pages[prev_page_id]
         return prev_page["offset"]
 
     def get_offset(self, vol_id: str, page_id: str) -> int:
-        self.get_pages(vol_id)
-        if "offset" not in self._metadata[vol_id]["pages"][page_id]:
+        page = self.get_pages(vol_id)[page_id]
+        if "offset" not in page:
             return self.__get_previous_offset(vol_id, page_id)
 
-        return self._metadata[vol_id]["pages"][page_id]["offset"]
+        return page["offset"]
 
 
 class ImageManager:
@@ -143,9 +139,9 @@ class ImageManager:
 
     @property
     def vol2imagegroup(self):
-        if self._vol2imagegroup:
-            return self._vol2imagegroup
-        return json.load(self.vol2imagegroup_fn.open())
+        if self._vol2imagegroup is None:
+            self._vol2imagegroup = json.load(self.vol2imagegroup_fn.open())
+        return self._vol2imagegroup
 
     def __get_image_order(self, vol_id: str, page_id: str):
         return int(page_id) + self.metadata.get_offset(vol_id, page_id)